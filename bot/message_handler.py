@@ -1,10 +1,17 @@
 from datetime import datetime, timedelta, time
+import bisect
 import re
 from typing import List
 from utils.date_utils import parse_date_time
 import logging
 import calendar
 
+# Shared bullet prefix for list-style responses.
+BULLET = "• "
+
+# Room names accepted by the booking commands.
+ROOM_NAMES = frozenset(('nest', 'treehouse', 'lighthouse', 'raven', 'hummingbird'))
+
 class MessageHandler:
     def __init__(self, room_manager):
         self.room_manager = room_manager
@@ -26,18 +33,21 @@ class MessageHandler:
             if not target_date:
                 return "Invalid date format. Please use a format like 'tomorrow' or '22/11/23'."
             
-            response = [f"Available rooms for {target_date.strftime('%B %d')}:"]
-            
+            response = []
+            found = False
+
             for room in sorted(self.room_manager.rooms.values(), key=lambda x: x.name):
                 available_slots = self.room_manager.get_available_slots(room.room_id, target_date)
                 if available_slots:
+                    found = True
                     response.append(f"\n{room.name} (Capacity: {room.capacity}):")
                     for start, end in available_slots:
-                        response.append(f"• {start.strftime('%I:%M %p')} - {end.strftime('%I:%M %p')}")
-            
-            if len(response) == 1:  # Only has the header
+                        response.append(f"{BULLET}{start.strftime('%I:%M %p')} - {end.strftime('%I:%M %p')}")
+
+            if not found:
                 return f"No available rooms found for {target_date.strftime('%B %d')}."
-            
+
+            response.insert(0, f"Available rooms for {target_date.strftime('%B %d')}:")
             return "\n".join(response)
         
         # Handle other list rooms commands
@@ -90,48 +100,70 @@ class MessageHandler:
                 "*Date formats:* 'today', 'tomorrow', '28th Nov', '22nd of November', '19/12', '19/12/2024'\n"
                 "*Supported Frequencies:* daily, weekly, biweekly, monthly\n"
                 "*Duration formats accepted:*\n"
-                "• Hours: '3h', '3 h', '3 hours'\n"
-                "• Minutes: '45m', '45 m', '45 minutes'\n"
-                "• Combined: '2 hours 30 minutes', '2h 30m'\n\n"
+                f"{BULLET}Hours: '3h', '3 h', '3 hours'\n"
+                f"{BULLET}Minutes: '45m', '45 m', '45 minutes'\n"
+                f"{BULLET}Combined: '2 hours 30 minutes', '2h 30m'\n\n"
                 )
         
-        # Extract values
-        room_id = room_match.group(1).upper()
-        date_str = date_match.group(1)
-        time_str = time_match.group(1)
-        
-        # Parse the date and time
+        # Extract values and parse duration with support for minutes
+        duration_minutes = self._parse_duration(duration_match.group(1))
+        return self._execute_booking(
+            room_match.group(1).upper(), date_match.group(1), time_match.group(1),
+            duration_minutes, event_match.group(1).strip(), type_match.group(1),
+            name_match.group(1).strip(), user_id
+        )
+
+    def handle_book(self, parts: List[str], user_id: str) -> str:
+        """Book from pre-split slash-command fields.
+
+        Single bookings arrive as [room, date, time, duration, event,
+        internal/client, contact name] and skip the regex pass entirely;
+        recurring or unrecognized shapes fall back to the message path.
+        """
+        if len(parts) == 7:
+            room = parts[0].lower()
+            meeting_type = parts[5].lower()
+            if room in ROOM_NAMES and meeting_type in ('internal', 'client'):
+                try:
+                    duration_minutes = self._parse_duration(parts[3].lower())
+                except ValueError as e:
+                    return str(e)
+                return self._execute_booking(
+                    room.upper(), parts[1].lower(), parts[2].lower(),
+                    duration_minutes, parts[4].lower(), meeting_type,
+                    parts[6].lower(), user_id
+                )
+        return self.handle_message("book " + ", ".join(parts), user_id)
+
+    def _execute_booking(self, room_id: str, date_str: str, time_str: str,
+                         duration_minutes: int, event_name: str, meeting_type: str,
+                         contact_name: str, user_id: str) -> str:
+        """Check availability and create a single booking, returning reply text."""
         start_time = parse_date_time(date_str, time_str)
         if not start_time:
             return "I couldn't understand the date and time. Please try again."
-            
-        # Parse duration with support for minutes
-        duration_minutes = self._parse_duration(duration_match.group(1))
-        
-        # Get other details
-        event_name = event_match.group(1).strip()
-        meeting_type = type_match.group(1)
-        contact_name = name_match.group(1).strip()
-        
+
+        dur = timedelta(minutes=duration_minutes)
+
         # Check room availability
         if not self.room_manager.check_room_availability(room_id, start_time, duration_minutes):
             alternatives = self.room_manager.get_alternative_suggestions(room_id, start_time, duration_minutes)
             return self._format_alternative_suggestions(alternatives)
-            
+
         # Create booking
         booking = self.room_manager.book_room(
             room_id, start_time, duration_minutes,
             event_name, meeting_type, contact_name, user_id
         )
-        
+
         if booking:
             return (
                 f"Room {booking['room_name']} booked:\n"
-                f"• Date: {start_time.strftime('%B %d, %Y')}\n"
-                f"• Time: {start_time.strftime('%I:%M %p')} - {(start_time + timedelta(minutes=duration_minutes)).strftime('%I:%M %p')}\n"
-                f"• Event: {event_name}\n"
-                f"• Type: {meeting_type}\n"
-                f"• Contact: {contact_name}"
+                f"{BULLET}Date: {start_time.strftime('%B %d, %Y')}\n"
+                f"{BULLET}Time: {start_time.strftime('%I:%M %p')} - {(start_time + dur).strftime('%I:%M %p')}\n"
+                f"{BULLET}Event: {event_name}\n"
+                f"{BULLET}Type: {meeting_type}\n"
+                f"{BULLET}Contact: {contact_name}"
             )
         return "Sorry, I couldn't book that room."
 
@@ -166,10 +198,10 @@ class MessageHandler:
         
         raise ValueError(
             "Invalid duration format. Please use one of:\n"
-            "• '3h' or '3 h' for hours\n"
-            "• '45m', '45 min' or '45 minutes' for minutes\n"
-            "• '2h 30m', '1h 45min' for combined\n"
-            "• '2 hours 30 minutes' or '2 hours and 30 minutes'"
+            f"{BULLET}'3h' or '3 h' for hours\n"
+            f"{BULLET}'45m', '45 min' or '45 minutes' for minutes\n"
+            f"{BULLET}'2h 30m', '1h 45min' for combined\n"
+            f"{BULLET}'2 hours 30 minutes' or '2 hours and 30 minutes'"
         )
 
     def _handle_cancellation_request(self, user_id: str) -> str:
@@ -190,9 +222,9 @@ class MessageHandler:
             )
         
         booking_list.append("\nTo cancel a booking, use one of:")
-        booking_list.append("• `/mybookings cancel <number>` (e.g., 1)")
-        booking_list.append("• `/mybookings cancel <numbers>` (e.g., 1,2,4)")
-        booking_list.append("• `/mybookings cancel all`")
+        booking_list.append(f"{BULLET}`/mybookings cancel <number>` (e.g., 1)")
+        booking_list.append(f"{BULLET}`/mybookings cancel <numbers>` (e.g., 1,2,4)")
+        booking_list.append(f"{BULLET}`/mybookings cancel all`")
         
         return "\n".join(booking_list)
 
@@ -229,18 +261,21 @@ class MessageHandler:
         if not target_date:
             return "Invalid date format. Please use a format like 'tomorrow' or '22/11/23'."
         
-        response = [f"Available rooms on floor {floor_number} for {target_date.strftime('%B %d')}:"]
-        
+        response = []
+        found = False
+
         for room in sorted(floor_rooms, key=lambda x: x.name):
             available_slots = self.room_manager.get_available_slots(room.room_id, target_date)
             if available_slots:
+                found = True
                 response.append(f"\n{room.name} (Capacity: {room.capacity}):")
                 for start, end in available_slots:
-                    response.append(f"• {start.strftime('%I:%M %p')} - {end.strftime('%I:%M %p')}")
-        
-        if len(response) == 1:  # Only has the header
-            response.append("No rooms available on this date.")
-        
+                    response.append(f"{BULLET}{start.strftime('%I:%M %p')} - {end.strftime('%I:%M %p')}")
+
+        if not found:
+            return f"No rooms available on floor {floor_number} for {target_date.strftime('%B %d')}."
+
+        response.insert(0, f"Available rooms on floor {floor_number} for {target_date.strftime('%B %d')}:")
         return "\n".join(response)
 
     def _format_alternative_suggestions(self, alternatives: dict) -> str:
@@ -253,9 +288,9 @@ class MessageHandler:
             meeting_type_text = "a client meeting" if conflicting_booking['meeting_type'] == 'client' else "an internal meeting"
             response.extend([
                 "That time is not available:",
-                f"• {conflicting_booking['room_name']} is booked for '{conflicting_booking['event_name']}' for {meeting_type_text}",
-                f"• Time: {conflicting_booking['start_time'].strftime('%I:%M %p')} - {conflicting_booking['end_time'].strftime('%I:%M %p')}",
-                f"• Contact: {conflicting_booking['contact_name']}\n"
+                f"{BULLET}{conflicting_booking['room_name']} is booked for '{conflicting_booking['event_name']}' for {meeting_type_text}",
+                f"{BULLET}Time: {conflicting_booking['start_time'].strftime('%I:%M %p')} - {conflicting_booking['end_time'].strftime('%I:%M %p')}",
+                f"{BULLET}Contact: {conflicting_booking['contact_name']}\n"
             ])
         else:
             response.append("That time is not available.")
@@ -265,12 +300,12 @@ class MessageHandler:
         if alternatives["available_times"]:
             response.append("\nOther times for the same room:")
             for time in alternatives["available_times"][:8]:  # Show max 8 alternatives
-                response.append(f"• {time.strftime('%I:%M %p')}")
+                response.append(f"{BULLET}{time.strftime('%I:%M %p')}")
                 
         if alternatives["other_rooms"]:
             response.append("\nOther available rooms at the requested time:")
             for room in alternatives["other_rooms"]:
-                response.append(f"• {room.name} (Capacity: {room.capacity})")
+                response.append(f"{BULLET}{room.name} (Capacity: {room.capacity})")
                 
         return "\n".join(response)
 
@@ -279,14 +314,14 @@ class MessageHandler:
         return (
             "Hello! Here are the available commands:\n\n"
             "*Begin Booking Process:*\n"
-            "• `/book` - Single bookings or recurring bookings\n"
+            f"{BULLET}`/book` - Single bookings or recurring bookings\n"
             "*Calendar View*\n"
-            "• `/calendar [month]` - View calendar for a month\n"
+            f"{BULLET}`/calendar [month]` - View calendar for a month\n"
             "*Other Commands:*\n"
-            "• `/rooms available [date]` - Check room availability\n"
-            "• `/rooms` - List all rooms\n"
-            "• `/mybookings` - View your bookings\n"
-            "• `/mybookings cancel [number(s)]` - Cancel specific bookings after viewing them\n"
+            f"{BULLET}`/rooms available [date]` - Check room availability\n"
+            f"{BULLET}`/rooms` - List all rooms\n"
+            f"{BULLET}`/mybookings` - View your bookings\n"
+            f"{BULLET}`/mybookings cancel [number(s)]` - Cancel specific bookings after viewing them\n"
         )
     
     def _handle_booking_cancellation(self, user_id: str, booking_numbers: List[int] = None, cancel_all: bool = False) -> str:
@@ -330,7 +365,7 @@ class MessageHandler:
         for booking in cancelled_bookings:
             start_time = datetime.fromisoformat(booking['start_time'])
             response.append(
-                f"• {booking['room_name']} on {start_time.strftime('%B %d at %I:%M %p')} - {booking['event_name']}"
+                f"{BULLET}{booking['room_name']} on {start_time.strftime('%B %d at %I:%M %p')} - {booking['event_name']}"
             )
         
         return "\n".join(response)
@@ -390,6 +425,7 @@ class MessageHandler:
             duration_minutes = amount
             if amount not in [15, 30, 45] and amount < 60:
                 return "For bookings less than 1 hour, please use 15, 30, or 45 minute intervals."
+        dur = timedelta(minutes=duration_minutes)
 
         # Get other details
         event_name = event_match.group(1).strip()
@@ -420,7 +456,7 @@ class MessageHandler:
 
         # Try to book each date individually
         for booking_date in booking_dates:
-            booking_end = booking_date + timedelta(minutes=duration_minutes)
+            booking_end = booking_date + dur
             
             # Check if this specific timeslot is available
             if self.room_manager.check_room_availability(room_id, booking_date, duration_minutes):
@@ -441,30 +477,37 @@ class MessageHandler:
         if successful_bookings:
             response.append(f"Successfully booked {room_id} for the following dates:")
             for date in successful_bookings:
-                response.append(f"• {date.strftime('%B %d')} from {date.strftime('%I:%M %p')} to {(date + timedelta(minutes=duration_minutes)).strftime('%I:%M %p')}")
+                response.append(f"{BULLET}{date.strftime('%B %d')} from {date.strftime('%I:%M %p')} to {(date + dur).strftime('%I:%M %p')}")
 
         if failed_bookings:
             if response:
                 response.append("\nThe following bookings could not be made due to conflicts:")
+            # The schedule is sorted by start_time, and isoformat strings sort
+            # chronologically, so each failed date's bookings can be located
+            # with a binary search instead of scanning the whole schedule.
+            schedule_sorted = sorted(self.room_manager.get_room_schedule(room_id),
+                                     key=lambda b: b['start_time'])
+            starts = [b['start_time'] for b in schedule_sorted]
             for date in failed_bookings:
                 # Get the conflicting booking for this date
-                conflicts = [b for b in self.room_manager.get_room_schedule(room_id) 
-                           if datetime.fromisoformat(b['start_time']).date() == date.date() and
-                           (datetime.fromisoformat(b['start_time']) <= date + timedelta(minutes=duration_minutes) and
+                lo = bisect.bisect_left(starts, date.date().isoformat())
+                hi = bisect.bisect_left(starts, (date.date() + timedelta(days=1)).isoformat())
+                conflicts = [b for b in schedule_sorted[lo:hi]
+                           if (datetime.fromisoformat(b['start_time']) <= date + dur and
                             datetime.fromisoformat(b['end_time']) >= date)]
-                
+
                 if conflicts:
                     conflict = conflicts[0]  # Get the first conflicting booking
                     response.append(
-                        f"• {date.strftime('%B %d')} at {date.strftime('%I:%M %p')} - "
-                        f"{(date + timedelta(minutes=duration_minutes)).strftime('%I:%M %p')} conflicts with existing booking:\n"
+                        f"{BULLET}{date.strftime('%B %d')} at {date.strftime('%I:%M %p')} - "
+                        f"{(date + dur).strftime('%I:%M %p')} conflicts with existing booking:\n"
                         f"  '{conflict['event_name']}' ({conflict['start_time'][11:16]} - "
                         f"{conflict['end_time'][11:16]}) - Contact: {conflict['contact_name']}"
                     )
                 else:
                     response.append(
-                        f"• {date.strftime('%B %d')} at {date.strftime('%I:%M %p')} - "
-                        f"{(date + timedelta(minutes=duration_minutes)).strftime('%I:%M %p')}"
+                        f"{BULLET}{date.strftime('%B %d')} at {date.strftime('%I:%M %p')} - "
+                        f"{(date + dur).strftime('%I:%M %p')}"
                     )
 
         return "\n".join(response)
@@ -488,166 +531,179 @@ class MessageHandler:
 
     def _handle_show_monthly_bookings(self, message: str) -> str:
         """Show monthly bookings in a calendar view."""
-        try:
-            # Parse month from message
-            month_str = message.replace('calendar view ', '').strip()
+        # Parse month from message
+        month_str = message.replace('calendar view ', '').strip()
             
-            # Room abbreviations mapping with order
-            room_order = ["NEST", "TREEHOUSE", "LIGHTHOUSE", "HUMMINGBIRD", "RAVEN"]
-            room_abbr = {
-                "NEST": "Nest",
-                "TREEHOUSE": "Tree",
-                "LIGHTHOUSE": "Lght",
-                "HUMMINGBIRD": "Hmng",
-                "RAVEN": "Ravn"
-            }
-
-            # Replace the sorted() calls with custom sorting based on room_order
-            def sort_by_room_order(room):
-                return room_order.index(room.room_id)
-
-            month_names = {month.lower(): i for i, month in enumerate(calendar.month_name) if month}
-            month_abbr = {month.lower(): i for i, month in enumerate(calendar.month_abbr) if month}
+        # Room abbreviations mapping with order
+        room_order = ["NEST", "TREEHOUSE", "LIGHTHOUSE", "HUMMINGBIRD", "RAVEN"]
+        room_abbr = {
+            "NEST": "Nest",
+            "TREEHOUSE": "Tree",
+            "LIGHTHOUSE": "Lght",
+            "HUMMINGBIRD": "Hmng",
+            "RAVEN": "Ravn"
+        }
+
+        # Replace the sorted() calls with custom sorting based on room_order
+        def sort_by_room_order(room):
+            return room_order.index(room.room_id)
+
+        month_names = {month.lower(): i for i, month in enumerate(calendar.month_name) if month}
+        month_abbr = {month.lower(): i for i, month in enumerate(calendar.month_abbr) if month}
             
-            month_str = month_str.lower()
-            if month_str in month_names:
-                month_num = month_names[month_str]
-            elif month_str in month_abbr:
-                month_num = month_abbr[month_str]
-            else:
-                return "Please specify a valid month, e.g., 'December' or 'Dec'"
-
-            current_year = datetime.now().year
-            if datetime.now().month > month_num:
-                current_year += 1
-
-            # First, create detailed bookings view
-            all_bookings = []
-            
-            for room in sorted(self.room_manager.rooms.values(), key=sort_by_room_order):  # Sort rooms by custom order
-                for booking in room.bookings:
-                    booking_start = datetime.fromisoformat(booking['start_time'])
-                    if booking_start.month == month_num and booking_start.year == current_year:
-                        all_bookings.append({
-                            'date': booking_start,
-                            'start': booking_start,
-                            'end': datetime.fromisoformat(booking['end_time']),
-                            'room': room_abbr[room.room_id],
-                            'event': booking['event_name'],
-                            'type': booking['meeting_type'],
-                            'contact': booking['contact_name']
-                        })
-
-            # Sort bookings by date, room (maintaining custom order), and time
-            def get_room_order(booking):
-                room_name = booking['room']
-                for room_id, abbr in room_abbr.items():
-                    if abbr == room_name:
-                        return room_order.index(room_id)
-                return len(room_order)  # fallback for unknown rooms
-
-            all_bookings.sort(key=lambda x: (x['date'].date(), get_room_order(x), x['start'].time()))
-
-            # Create response with detailed bookings
-            response = [f"Detailed Bookings - {calendar.month_name[month_num]} {current_year}:"]
-            current_date = None
-            current_room = None
+        month_str = month_str.lower()
+        if month_str in month_names:
+            month_num = month_names[month_str]
+        elif month_str in month_abbr:
+            month_num = month_abbr[month_str]
+        else:
+            return "Please specify a valid month, e.g., 'December' or 'Dec'"
+
+        current_year = datetime.now().year
+        if datetime.now().month > month_num:
+            current_year += 1
+
+        # Bind hot lookups as locals so the traversal below doesn't pay
+        # attribute/global lookups per booking
+        rooms = self.room_manager.rooms
+        _iso = datetime.fromisoformat
+
+        # One traversal feeds both views: the detailed list and a per-day
+        # index for the calendar grid (day number -> per-room booking
+        # groups, rooms kept in custom order).
+        all_bookings = []
+        by_day = {}
+
+        # Cheap string-prefix filter: stored times are isoformat
+        # (YYYY-MM-DDTHH:MM:SS), so bookings outside the target month
+        # can be skipped without parsing.
+        month_prefix = f"{current_year:04d}-{month_num:02d}"
+
+        for room in sorted(rooms.values(), key=sort_by_room_order):  # Sort rooms by custom order
+            room_days = {}
+            for booking in room.bookings:
+                if not booking['start_time'].startswith(month_prefix):
+                    continue
+                booking_start = _iso(booking['start_time'])
+                booking_end = _iso(booking['end_time'])
+                all_bookings.append({
+                    'date': booking_start,
+                    'start': booking_start,
+                    'end': booking_end,
+                    'display': booking['_display_short'],
+                    'room': room_abbr[room.room_id],
+                    'event': booking['event_name'],
+                    'type': booking['meeting_type'],
+                    'contact': booking['contact_name']
+                })
+                room_days.setdefault(booking_start.day, []).append({
+                    'start': booking_start,
+                    'end': booking_end,
+                    'display': booking['_display_short'],
+                    'room': room_abbr[room.room_id]
+                })
+            for day_num, group in room_days.items():
+                group.sort(key=lambda x: x['start'])
+                by_day.setdefault(day_num, []).append(group)
+
+        # Sort bookings by date, room (maintaining custom order), and time
+        def get_room_order(booking):
+            room_name = booking['room']
+            for room_id, abbr in room_abbr.items():
+                if abbr == room_name:
+                    return room_order.index(room_id)
+            return len(room_order)  # fallback for unknown rooms
+
+        all_bookings.sort(key=lambda x: (x['date'].date(), get_room_order(x), x['start'].time()))
+
+        # Create response with detailed bookings
+        response = [f"Detailed Bookings - {calendar.month_name[month_num]} {current_year}:"]
+        current_date = None
+        current_room = None
             
-            for booking in all_bookings:
-                booking_date = booking['date'].date()
-                if booking_date != current_date:
-                    current_date = booking_date
-                    current_room = None
-                    response.append(f"\n{booking_date.strftime('%B %d (%A)')}")
+        for booking in all_bookings:
+            booking_date = booking['date'].date()
+            if booking_date != current_date:
+                current_date = booking_date
+                current_room = None
+                response.append(f"\n{booking_date.strftime('%B %d (%A)')}")
                 
-                if booking['room'] != current_room:
-                    if current_room is not None:  # Add space between rooms
-                        response.append("")
-                    current_room = booking['room']
+            if booking['room'] != current_room:
+                if current_room is not None:  # Add space between rooms
+                    response.append("")
+                current_room = booking['room']
                 
-                response.append(
-                    f"• {booking['start'].strftime('%H:%M')}-{booking['end'].strftime('%H:%M')} - "
-                    f"{booking['room']} - {booking['event']} - Contact: {booking['contact']}"
-                )
+            response.append(
+                f"{BULLET}{booking['display']} - "
+                f"{booking['room']} - {booking['event']} - Contact: {booking['contact']}"
+            )
 
-            # Add calendar view header
-            response.extend([
-                f"\n📅 Calendar - {calendar.month_name[month_num]} {current_year}\n",
-                "```"
-            ])
+        # Add calendar view header
+        response.extend([
+            f"\n📅 Calendar - {calendar.month_name[month_num]} {current_year}\n",
+            "```"
+        ])
             
-            # Create calendar view
-            CELL_WIDTH = 18
+        # Create calendar view
+        CELL_WIDTH = 18
+        EMPTY_CELL = " " * CELL_WIDTH
             
-            # Add weekday headers
-            header = "".join(day.ljust(CELL_WIDTH) for day in ["MON", "TUE", "WED", "THU", "FRI"])
-            response.append(header)
-            response.append("─" * (CELL_WIDTH * 5))
+        # Add weekday headers
+        header = "".join(day.ljust(CELL_WIDTH) for day in ["MON", "TUE", "WED", "THU", "FRI"])
+        response.append(header)
+        response.append("─" * (CELL_WIDTH * 5))
             
-            # Process each week
-            cal = calendar.monthcalendar(current_year, month_num)
-            for week in cal:
-                week_lines = [""] * 20  # Increased max lines per week to accommodate more bookings
-                max_lines_used = 1  # At least show the date line
-                
-                # Process only weekdays
-                for day_idx in range(min(5, len(week))):
-                    day = week[day_idx]
-                    if day == 0:
-                        # Empty day
-                        for i in range(20):
-                            week_lines[i] += " " * CELL_WIDTH
-                        continue
-                    
-                    # Get all bookings for this day
-                    date = datetime(current_year, month_num, day)
-                    day_bookings = []
-                    for room in sorted(self.room_manager.rooms.values(), key=sort_by_room_order):  # Sort rooms by custom order
-                        room_bookings = []
-                        for booking in room.bookings:
-                            booking_start = datetime.fromisoformat(booking['start_time'])
-                            booking_end = datetime.fromisoformat(booking['end_time'])
-                            if booking_start.date() == date.date():
-                                room_bookings.append({
-                                    'start': booking_start,
-                                    'end': booking_end,
-                                    'room': room_abbr[room.room_id]
-                                })
-                        if room_bookings:  # Only add room bookings if they exist
-                            if day_bookings:  # Add spacing between rooms
-                                day_bookings.append(None)  # None represents a blank line
-                            day_bookings.extend(sorted(room_bookings, key=lambda x: x['start']))
+        # Process each week; monthdatescalendar yields full weeks of date
+        # objects (Monday first), so the first five entries of each week
+        # are exactly the weekdays
+        cal = calendar.Calendar().monthdatescalendar(current_year, month_num)
+        for week in cal:
+            # One list of cells per line; joined at the end of the week so
+            # line building isn't repeated string concatenation
+            week_cells = [[] for _ in range(20)]  # Increased max lines per week to accommodate more bookings
+            max_lines_used = 1  # At least show the date line
+
+            # Process only weekdays
+            for day_date in week[:5]:
+                if day_date.month != month_num:
+                    # Day belongs to the adjacent month
+                    for cells in week_cells:
+                        cells.append(EMPTY_CELL)
+                    continue
+                day = day_date.day
+
+                # Get all bookings for this day from the per-day index
+                day_bookings = []
+                for group in by_day.get(day, []):
+                    if day_bookings:  # Add spacing between rooms
+                        day_bookings.append(None)  # None represents a blank line
+                    day_bookings.extend(group)
+
+                # Format day cell with asterisks
+                week_cells[0].append(f"*{day}*".ljust(CELL_WIDTH))
+
+                # Add each booking on its own line
+                line_idx = 1
+                for booking in day_bookings:
+                    if booking is None:  # Add blank line between rooms
+                        week_cells[line_idx].append(EMPTY_CELL)
+                    else:
+                        booking_str = f"{booking['display']} {booking['room']}"
+                        week_cells[line_idx].append(booking_str.ljust(CELL_WIDTH))
+                    line_idx += 1
+                    max_lines_used = max(max_lines_used, line_idx)
                     
-                    # Format day cell with asterisks
-                    week_lines[0] += f"*{day}*".ljust(CELL_WIDTH)
-                    
-                    # Add each booking on its own line
-                    line_idx = 1
-                    for booking in day_bookings:
-                        if booking is None:  # Add blank line between rooms
-                            week_lines[line_idx] += " " * CELL_WIDTH
-                        else:
-                            booking_str = (f"{booking['start'].strftime('%H:%M')}-"
-                                         f"{booking['end'].strftime('%H:%M')} "
-                                         f"{booking['room']}")
-                            week_lines[line_idx] += booking_str.ljust(CELL_WIDTH)
-                        line_idx += 1
-                        max_lines_used = max(max_lines_used, line_idx)
-                    
-                    # Fill remaining lines with spaces
-                    for i in range(line_idx, 20):
-                        week_lines[i] += " " * CELL_WIDTH
-                
-                # Add non-empty lines to response
-                response.extend(line.rstrip() for line in week_lines[:max_lines_used])
-                response.append("─" * (CELL_WIDTH * 5))
+                # Fill remaining lines with spaces
+                for i in range(line_idx, 20):
+                    week_cells[i].append(EMPTY_CELL)
+
+            # Add non-empty lines to response
+            response.extend("".join(cells).rstrip() for cells in week_cells[:max_lines_used])
+            response.append("─" * (CELL_WIDTH * 5))
             
-            response.append("```")
-            return "\n".join(response)
+        response.append("```")
+        return "\n".join(response)
             
-        except Exception as e:
-            logging.error(f"Error in _handle_show_monthly_bookings: {str(e)}")
-            return "Sorry, I encountered an error while creating the calendar view. Please try again."
     
 
     
\ No newline at end of file
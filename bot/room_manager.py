@@ -1,16 +1,49 @@
+from collections import defaultdict
 from datetime import datetime, timedelta, time
 from typing import List, Dict, Optional, Tuple
+import bisect
 import json
 import os
 import logging
+import queue
+import threading
+
+try:
+    # orjson serializes/deserializes in C; fall back to stdlib json if the
+    # package isn't installed.
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+def _fast_parse_iso(s: str) -> datetime:
+    """Parse a timestamp produced by datetime.isoformat().
+
+    Stored booking times always have the fixed shape
+    YYYY-MM-DDTHH:MM:SS, so slicing the components directly skips the
+    format sniffing the general-purpose parser does.
+    """
+    return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                    int(s[11:13]), int(s[14:16]), int(s[17:19]))
+
 
 class Room:
+    # Rooms are iterated on every availability scan; slots keep instances
+    # small and make attribute reads direct slot loads.
+    __slots__ = ("room_id", "name", "capacity", "floor", "bookings", "_starts", "_ends")
+
     def __init__(self, room_id: str, name: str, capacity: int, floor: int):
         self.room_id = room_id
         self.name = name
         self.capacity = capacity
         self.floor = floor
+        # Kept sorted by start time; _starts/_ends are parallel lists of the
+        # interval endpoints so hot scans walk two flat datetime lists and
+        # only touch the booking dicts when details are needed.
         self.bookings: List[Dict] = []
+        self._starts: List[datetime] = []
+        self._ends: List[datetime] = []
 
     def to_dict(self) -> dict:
         return {
@@ -39,6 +72,18 @@ class RoomManager:
         self.data_dir = os.path.join(current_dir, 'data')
         self.data_file = os.path.join(self.data_dir, 'rooms.json')
         self.rooms: Dict[str, Room] = {}
+        # user_id -> list of (room, booking) pairs so user queries don't
+        # have to scan every room
+        self._user_index: Dict[str, List[Tuple[Room, Dict]]] = defaultdict(list)
+        # room_id -> date -> bookings that day (sorted by start time) so
+        # per-day queries are a dict lookup rather than a full-room scan
+        self._by_date: Dict[str, Dict] = defaultdict(dict)
+        # Saves happen on a background writer thread so booking handlers
+        # never block on disk I/O; queued requests are coalesced.
+        self._save_q: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+        self._last_mtime = None  # rooms.json mtime at last load/write
         self._load_rooms()
         self.last_booking_conflict = None  # Store the last booking conflict for template generation
 
@@ -49,17 +94,35 @@ class RoomManager:
             os.makedirs(self.data_dir, exist_ok=True)
             
             if os.path.exists(self.data_file):
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    for room_id, room_data in data.items():
-                        room = Room(
-                            room_id=room_id,
-                            name=room_data["name"],
-                            capacity=room_data["capacity"],
-                            floor=room_data.get("floor")
-                        )
-                        room.bookings = room_data.get("bookings", [])
-                        self.rooms[room.room_id] = room
+                with open(self.data_file, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                for room_id, room_data in data.items():
+                    room = Room(
+                        room_id=room_id,
+                        name=room_data["name"],
+                        capacity=room_data["capacity"],
+                        floor=room_data.get("floor")
+                    )
+                    room.bookings = room_data.get("bookings", [])
+                    # Cache parsed datetimes so availability checks don't
+                    # re-parse the ISO strings on every call. The underscore
+                    # keys are stripped again in _save_rooms.
+                    for booking in room.bookings:
+                        start_dt = _fast_parse_iso(booking["start_time"])
+                        end_dt = _fast_parse_iso(booking["end_time"])
+                        booking["_start_dt"] = start_dt
+                        booking["_end_dt"] = end_dt
+                        # Render-ready strings so display code skips strftime
+                        booking["_display_short"] = f"{start_dt:%H:%M}-{end_dt:%H:%M}"
+                        booking["_display_long"] = f"{start_dt:%Y-%m-%d %I:%M %p} - {end_dt:%I:%M %p}"
+                        self._user_index[booking.get("user_id")].append((room, booking))
+                        self._index_booking_by_date(room_id, booking)
+                    room.bookings.sort(key=lambda b: b["_start_dt"])
+                    room._starts = [b["_start_dt"] for b in room.bookings]
+                    room._ends = [b["_end_dt"] for b in room.bookings]
+                    self.rooms[room.room_id] = room
+                self._last_mtime = os.stat(self.data_file).st_mtime_ns
             else:
                 # Create default rooms with floor set to 10
                 default_rooms = [
@@ -73,69 +136,155 @@ class RoomManager:
                     self.rooms[room.room_id] = room
                 self._save_rooms()
         except Exception as e:
-            logging.error(f"Error loading rooms: {e}")
+            logger.error("Error loading rooms: %s", e)
             self.rooms = {}
 
+    def _index_booking_by_date(self, room_id: str, booking: Dict):
+        """Add a booking to the per-day index, keeping the day sorted."""
+        day_list = self._by_date[room_id].setdefault(booking["_start_dt"].date(), [])
+        bisect.insort(day_list, booking, key=lambda b: b["_start_dt"])
+
+    def _unindex_booking_by_date(self, room_id: str, booking: Dict):
+        """Remove a booking from the per-day index."""
+        day = booking["_start_dt"].date()
+        day_list = self._by_date[room_id].get(day)
+        if day_list is not None:
+            day_list[:] = [b for b in day_list if b is not booking]
+            if not day_list:
+                del self._by_date[room_id][day]
+
     def _save_rooms(self):
-        """Save current room state to JSON file."""
+        """Queue a save; the background writer coalesces pending requests."""
+        self._save_q.put(True)
+
+    def _writer_loop(self):
+        """Background thread: dequeue save requests and write each batch once."""
+        while True:
+            self._save_q.get()
+            # Drain anything queued while waiting so a burst of mutations
+            # results in a single write
+            while True:
+                try:
+                    self._save_q.get_nowait()
+                except queue.Empty:
+                    break
+            self._write_rooms()
+
+    def force_flush(self):
+        """Write current room state immediately (used on shutdown)."""
+        self._write_rooms()
+
+    def _write_rooms(self):
+        """Serialize current room state to the JSON file atomically."""
         try:
-            data = {
-                room.room_id: room.to_dict()
-                for room in self.rooms.values()
-            }
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            data = {}
+            for room in self.rooms.values():
+                room_dict = room.to_dict()
+                # Drop the cached underscore-prefixed values; only the ISO
+                # strings belong on disk.
+                room_dict["bookings"] = [
+                    {k: v for k, v in booking.items() if not k.startswith("_")}
+                    for booking in room.bookings
+                ]
+                data[room.room_id] = room_dict
+            # Write to a temp file and rename so a crash mid-write can't
+            # leave a torn rooms.json behind.
+            tmp_file = self.data_file + '.tmp'
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2).encode()
+            # One write syscall on a raw fd; no buffering layer needed for
+            # a single pre-serialized blob.
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.data_file)
+            self._last_mtime = os.stat(self.data_file).st_mtime_ns
         except Exception as e:
-            logging.error(f"Error saving rooms: {e}")
+            logger.error("Error saving rooms: %s", e)
+
+    def reload_if_changed(self):
+        """Re-read rooms.json only if it was modified outside this process.
+
+        Cheap to call before read-only queries: a matching mtime means the
+        on-disk state is the one already loaded and the parse is skipped.
+        """
+        try:
+            mtime = os.stat(self.data_file).st_mtime_ns
+        except OSError:
+            return
+        if mtime == self._last_mtime:
+            return
+        self.rooms = {}
+        self._user_index.clear()
+        self._by_date.clear()
+        self._load_rooms()
 
     def check_room_availability(self, room_id: str, start_time: datetime, duration_minutes: int) -> bool:
         """Check if a room is available for booking."""
-        if room_id not in self.rooms:
-            logging.debug(f"Room {room_id} not found")
+        room = self.rooms.get(room_id)
+        if room is None:
+            logger.debug("Room %s not found", room_id)
             return False
-        
-        # Calculate end time
+
         end_time = start_time + timedelta(minutes=duration_minutes)
-        
-        logging.debug(f"Checking availability for {room_id}")
-        logging.debug(f"Requested time: {start_time} to {end_time}")
-        
-        # Get all bookings for the room
-        bookings = self.get_room_schedule(room_id)
-        
-        # Check for conflicts with existing bookings ON THE SAME DAY
-        for booking in bookings:
-            booking_start = datetime.fromisoformat(booking["start_time"])
-            booking_end = datetime.fromisoformat(booking["end_time"])
-            
-            # Only check bookings on the same day
-            if booking_start.date() == start_time.date():
-                logging.debug(f"Checking booking: {booking_start} to {booking_end}")
-                
-                # Check if there's any overlap
-                if (start_time < booking_end and end_time > booking_start):
-                    logging.debug(f"Conflict found with booking: {booking['event_name']}")
-                    return False
-                
-        logging.debug("No conflicts found, room is available")
+        return self._check_room_obj_available(room, start_time, end_time)
+
+    def _check_room_obj_available(self, room: Room, start_time: datetime, end_time: datetime) -> bool:
+        """Overlap check against an already-resolved Room.
+
+        Internal helpers pass the Room object directly so loops don't pay
+        a dict probe per iteration. Bookings are kept sorted and
+        non-overlapping, so only the booking starting at or before the
+        requested slot and the one after it can conflict.
+        """
+        # Fast path: if the requested day has no bookings at all (and the
+        # request doesn't span midnight) there is nothing to conflict with.
+        # The per-day index keys double as the set of days with bookings.
+        if (start_time.date() not in self._by_date[room.room_id]
+                and end_time.date() == start_time.date()):
+            return True
+
+        starts = room._starts
+        ends = room._ends
+        idx = bisect.bisect_right(starts, start_time) - 1
+        for i in range(max(idx, 0), min(idx + 2, len(starts))):
+            # Check if there's any overlap
+            if (start_time < ends[i] and end_time > starts[i]):
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Conflict found with booking: %s", room.bookings[i]['event_name'])
+                return False
         return True
 
     def find_available_room(self, start_time: datetime, duration_minutes: int) -> Optional[Room]:
         """Find an available room for the specified time slot."""
-        for room in self.rooms.values():
-            if self.check_room_availability(room.room_id, start_time, duration_minutes):
-                return room
-        return None
-    def book_room(self, room_name: str, start_time: datetime, duration_minutes: int, 
+        return next(iter(self.list_available_rooms(start_time, duration_minutes)), None)
+    def book_room(self, room_name: str, start_time: datetime, duration_minutes: int,
                   event_name: str, meeting_type: str, contact_name: str, user_id: str) -> Optional[dict]:
         """Book a room if available."""
+        booking = self._book_room_nosave(
+            room_name, start_time, duration_minutes,
+            event_name, meeting_type, contact_name, user_id
+        )
+        if booking:
+            # Save updated bookings to file
+            self._save_rooms()
+        return booking
+
+    def _book_room_nosave(self, room_name: str, start_time: datetime, duration_minutes: int,
+                          event_name: str, meeting_type: str, contact_name: str, user_id: str) -> Optional[dict]:
+        """Add a booking in memory without persisting; callers that book in
+        bulk flush once via _save_rooms afterwards."""
         # Make room name case-insensitive
         room_name = room_name.upper()
-        
+
         # Check if room exists
         if room_name not in self.rooms:
             return None
-        
+
         room = self.rooms[room_name]
 
         # Calculate end time
@@ -145,6 +294,10 @@ class RoomManager:
         new_booking = {
             "start_time": start_time.isoformat(),
             "end_time": end_time.isoformat(),
+            "_start_dt": start_time,
+            "_end_dt": end_time,
+            "_display_short": f"{start_time:%H:%M}-{end_time:%H:%M}",
+            "_display_long": f"{start_time:%Y-%m-%d %I:%M %p} - {end_time:%I:%M %p}",
             "duration_minutes": duration_minutes,
             "event_name": event_name,
             "meeting_type": meeting_type,
@@ -152,11 +305,18 @@ class RoomManager:
             "user_id": user_id  # Store the Slack user ID
         }
 
-        # Add booking to room's schedule
-        room.bookings.append(new_booking)
-
-        # Save updated bookings to file
-        self._save_rooms()
+        # Insert into the room's schedule keeping it sorted by start time.
+        # (room, start time) acts as the booking's key — cancel_booking
+        # matches on the exact start — so refuse duplicates outright.
+        idx = bisect.bisect_right(room._starts, start_time)
+        if idx > 0 and room._starts[idx - 1] == start_time:
+            logger.debug("Duplicate booking slot for %s at %s", room_name, start_time)
+            return None
+        room.bookings.insert(idx, new_booking)
+        room._starts.insert(idx, start_time)
+        room._ends.insert(idx, end_time)
+        self._user_index[user_id].append((room, new_booking))
+        self._index_booking_by_date(room.room_id, new_booking)
 
         # Return booking confirmation
         return {
@@ -171,17 +331,15 @@ class RoomManager:
         """Get all bookings for a room."""
         if room_id not in self.rooms:
             return []
-        return sorted(
-            self.rooms[room_id].bookings,
-            key=lambda x: datetime.fromisoformat(x["start_time"])
-        )
+        # Already kept sorted by start time on insert
+        return self.rooms[room_id].bookings
 
     def cancel_booking(self, room_id: str, start_time: datetime, user_id: str) -> tuple[bool, str]:
         """Cancel a booking if the user is authorized."""
-        logging.debug(f"Attempting to cancel booking - Room: {room_id}, Time: {start_time}, User: {user_id}")
+        logger.debug("Attempting to cancel booking - Room: %s, Time: %s, User: %s", room_id, start_time, user_id)
         
         if room_id not in self.rooms:
-            logging.debug(f"Room not found: {room_id}")
+            logger.debug("Room not found: %s", room_id)
             return False, "Room not found."
 
         room = self.rooms[room_id]
@@ -191,23 +349,31 @@ class RoomManager:
             if booking.get("start_time") == start_time_str:
                 # Check if the user is authorized to cancel
                 if booking.get("user_id") != user_id:
-                    logging.debug(f"Unauthorized cancellation attempt - Booking user: {booking.get('user_id')}, Request user: {user_id}")
+                    logger.debug("Unauthorized cancellation attempt - Booking user: %s, Request user: %s", booking.get('user_id'), user_id)
                     return False, "You are not authorized to cancel this booking."
                 
-                # Remove the booking
-                logging.debug(f"Cancelling booking: {booking}")
+                # Remove the booking (and its index entries)
+                logger.debug("Cancelling booking: %s", booking)
                 room.bookings.pop(i)
+                room._starts.pop(i)
+                room._ends.pop(i)
+                uid = booking.get("user_id")
+                self._user_index[uid] = [
+                    entry for entry in self._user_index[uid] if entry[1] is not booking
+                ]
+                self._unindex_booking_by_date(room_id, booking)
                 self._save_rooms()
                 return True, f"Booking cancelled successfully for {room.name}."
         
-        logging.debug("No matching booking found")
+        logger.debug("No matching booking found")
         return False, "No booking found for the specified time."
 
     def list_available_rooms(self, start_time: datetime, duration_minutes: int) -> List[Room]:
         """List all rooms available at the specified time."""
+        end_time = start_time + timedelta(minutes=duration_minutes)
         available_rooms = []
         for room in self.rooms.values():
-            if self.check_room_availability(room.room_id, start_time, duration_minutes):
+            if self._check_room_obj_available(room, start_time, end_time):
                 available_rooms.append(room)
         return available_rooms
 
@@ -224,11 +390,8 @@ class RoomManager:
         
         schedule = [f"*{room.name}* (Capacity: {room.capacity})\nUpcoming bookings:"]
         for booking in bookings:
-            start = datetime.fromisoformat(booking["start_time"])
-            end = datetime.fromisoformat(booking["end_time"])
             schedule.append(
-                f"• {start.strftime('%Y-%m-%d %I:%M %p')} - "
-                f"{end.strftime('%I:%M %p')} "
+                f"• {booking['_display_long']} "
                 f"({booking['duration_minutes']} minutes)"
             )
         
@@ -261,15 +424,25 @@ class RoomManager:
         # Check every hour from 9 AM to 5 PM
         start_hour = 9
         end_hour = 17
-        
+
         current_time = datetime.combine(date.date(), datetime.min.time().replace(hour=start_hour))
         end_time = datetime.combine(date.date(), datetime.min.time().replace(hour=end_hour))
-        
+
+        # Walk the hour grid against the day's sorted bookings with a single
+        # moving pointer instead of running a full availability check per slot
+        day_date = date.date()
+        day_bookings = [b for b in room.bookings if b['_start_dt'].date() == day_date]
+        dur = timedelta(minutes=duration_minutes)
+        ptr = 0
+        n = len(day_bookings)
+
         while current_time <= end_time:
-            if self.check_room_availability(room_id, current_time, duration_minutes):
+            while ptr < n and day_bookings[ptr]['_end_dt'] <= current_time:
+                ptr += 1
+            if not (ptr < n and day_bookings[ptr]['_start_dt'] < current_time + dur):
                 available_times.append(current_time)
             current_time += timedelta(hours=1)
-        
+
         return available_times
 
     def get_alternative_suggestions(self, room_id: str, start_time: datetime, duration_minutes: int) -> dict:
@@ -280,8 +453,8 @@ class RoomManager:
         
         if room:
             for booking in room.bookings:
-                booking_start = datetime.fromisoformat(booking['start_time'])
-                booking_end = datetime.fromisoformat(booking['end_time'])
+                booking_start = booking['_start_dt']
+                booking_end = booking['_end_dt']
                 if (start_time >= booking_start and start_time < booking_end):
                     conflicting_booking = {
                         **booking,
@@ -315,8 +488,8 @@ class RoomManager:
         target_time = start_time.isoformat()
         
         for booking in bookings:
-            booking_start = datetime.fromisoformat(booking["start_time"])
-            booking_end = datetime.fromisoformat(booking["end_time"])
+            booking_start = booking["_start_dt"]
+            booking_end = booking["_end_dt"]
             
             if (start_time >= booking_start and start_time < booking_end):
                 return {
@@ -331,18 +504,16 @@ class RoomManager:
     def get_user_bookings(self, user_id: str) -> List[Dict]:
         """Get all active bookings for a specific user."""
         current_time = datetime.now()
-        user_bookings = []
-        
-        for room in self.rooms.values():
-            for booking in room.bookings:
-                booking_time = datetime.fromisoformat(booking['start_time'])
-                if booking.get('user_id') == user_id and booking_time > current_time:
-                    user_bookings.append({
-                        **booking,
-                        'room_id': room.room_id,
-                        'room_name': room.name
-                    })
-        
+        user_bookings = [
+            {
+                **booking,
+                'room_id': room.room_id,
+                'room_name': room.name
+            }
+            for room, booking in self._user_index.get(user_id, [])
+            if booking['_start_dt'] > current_time
+        ]
+
         # Sort by start time
         user_bookings.sort(key=lambda x: x['start_time'])
         return user_bookings
@@ -370,7 +541,7 @@ class RoomManager:
             booking = bookings[num - 1]
             success = self._remove_booking(booking['room_id'], booking['start_time'], user_id)
             if success:
-                cancelled.append(f"{booking['room_name']} on {datetime.fromisoformat(booking['start_time']).strftime('%B %d at %I:%M %p')}")
+                cancelled.append(f"{booking['room_name']} on {booking['_start_dt'].strftime('%B %d at %I:%M %p')}")
             else:
                 errors.append(f"Failed to cancel booking #{num}")
         
@@ -400,19 +571,13 @@ class RoomManager:
         day_start = datetime.combine(date.date(), time(start_hour, 0))
         day_end = datetime.combine(date.date(), time(end_hour, 0))
         
-        # Get all bookings for this room on this date
-        bookings = []
-        for booking in room.bookings:
-            booking_start = datetime.fromisoformat(booking["start_time"])
-            booking_end = datetime.fromisoformat(booking["end_time"])
-            
-            # Only consider bookings that overlap with this day
-            if (booking_start.date() == date.date() or booking_end.date() == date.date()):
-                bookings.append((booking_start, booking_end))
-        
-        # Sort bookings by start time
-        bookings.sort(key=lambda x: x[0])
-        
+        # Get this day's bookings from the per-day index (already sorted
+        # by start time)
+        bookings = [
+            (b["_start_dt"], b["_end_dt"])
+            for b in self._by_date[room_id].get(date.date(), [])
+        ]
+
         # Find available slots
         available_slots = []
         current_time = day_start
@@ -465,10 +630,14 @@ class RoomManager:
         failed_bookings = []
         current_date = start_date
 
+        # Resolve the room once instead of re-probing the dict per occurrence
+        room = self.rooms.get(room_id.upper())
+        dur = timedelta(minutes=duration_minutes)
+
         # First, check all dates for availability
         dates_to_book = []
         while current_date.date() <= end_date.date():
-            if self.check_room_availability(room_id, current_date, duration_minutes):
+            if room is not None and self._check_room_obj_available(room, current_date, current_date + dur):
                 dates_to_book.append(current_date)
             else:
                 failed_bookings.append(current_date)
@@ -486,9 +655,10 @@ class RoomManager:
                 else:
                     current_date = current_date.replace(month=current_date.month + 1)
 
-        # Then, book all available dates
+        # Then, book all available dates in memory and persist once at the
+        # end instead of rewriting the file per occurrence
         for booking_date in dates_to_book:
-            booking = self.book_room(
+            booking = self._book_room_nosave(
                 room_id, booking_date, duration_minutes,
                 event_name, meeting_type, contact_name, user_id
             )
@@ -497,4 +667,7 @@ class RoomManager:
             else:
                 failed_bookings.append(booking_date)
 
+        if successful_bookings:
+            self._save_rooms()
+
         return successful_bookings, failed_bookings
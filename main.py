@@ -2,31 +2,38 @@
 from slack_integration.slack_bot import SlackBot
 from bot.room_manager import RoomManager
 from config.config import SLACK_APP_TOKEN
+import logging
 import signal
 import sys
-import time
-
-def signal_handler(sig, frame):
-    print("\nShutting down gracefully...")
-    sys.exit(0)
 
 def main():
-    # Set up signal handler for graceful shutdown
-    signal.signal(signal.SIGINT, signal_handler)
-    
+    # The entry point owns the logging configuration; library modules
+    # only create their own loggers
+    logging.basicConfig(level=logging.INFO)
+
     # Initialize RoomManager
     room_manager = RoomManager()
-    
+
+    # Set up signal handler for graceful shutdown; flush any pending
+    # room-state writes before exiting
+    def signal_handler(sig, frame):
+        print("\nShutting down gracefully...")
+        room_manager.force_flush()
+        sys.exit(0)
+
+    signal.signal(signal.SIGINT, signal_handler)
+
     # Initialize and start SlackBot with token from config
     bot = SlackBot(slack_token=SLACK_APP_TOKEN, room_manager=room_manager)
     bot.start()
-    
-    # Keep the main thread alive
+
+    # Keep the main thread alive; pause() blocks in the kernel until a
+    # signal arrives instead of waking up every second
     try:
-        while True:
-            time.sleep(1)
+        signal.pause()
     except KeyboardInterrupt:
         print("\nShutting down gracefully...")
+        room_manager.force_flush()
         sys.exit(0)
 
 if __name__ == "__main__":
@@ -5,11 +5,43 @@ from slack_sdk.socket_mode.request import SocketModeRequest
 from bot.room_manager import RoomManager
 from config.config import SLACK_BOT_TOKEN
 from bot.message_handler import MessageHandler
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Static reply text built once at import rather than re-concatenated on
+# every command
+_BOOK_HELP = (
+    "Please use one of these formats:\n\n"
+    "*Single Booking:*\n"
+    "`/book [room], [date], [time], [duration], [event details], [internal/client], [Full Contact Name]`\n\n"
+    "*Recurring Booking:*\n"
+    "`/book recurring [room], [start date], [end date], [frequency], [time], [duration], [event details], [internal/client], [Full Contact Name]`\n\n"
+    "*Examples:*\n"
+    "• `/book nest, tomorrow, 2pm, 2 hours, Team Meeting, internal, John Smith`\n"
+    "• `/book recurring nest, 22nd Nov, 22nd Dec, weekly, 2pm, 2 hours, Team Sync, internal, John Smith`\n"
+    "*Date formats:* 'today', 'tomorrow', '28th Nov', '22nd of November', '19/12', '19/12/2024'\n"
+    "*Supported Frequencies:* daily, weekly, biweekly, monthly\n"
+    "*Duration formats accepted:*\n"
+    "• Hours: '3h', '3 h', '3 hours'\n"
+    "• Minutes: '45m', '45 m', '45 minutes'\n"
+    "• Combined: '2 hours 30 minutes', '2h 30m'\n\n"
+)
+
+_WELCOME_MSG = (
+    "Hello! Here are the available commands:\n\n"
+    "*Begin Booking Process:*\n"
+    "• `/book` - Single bookings or recurring bookings\n"
+    "*Calendar View*\n"
+    "• `/calendar [month]` - View calendar for a specific month\n"
+    "*Other Commands:*\n"
+    "• `/rooms` - List all rooms\n"
+    "• `/rooms available [date]` - Check room availability\n"
+    "• `/mybookings` - View your bookings\n"
+    "• `/mybookings cancel [number(s)]` - Cancel specific bookings after viewing them\n"
+)
+
 class SlackBot:
     def __init__(self, slack_token: str, room_manager: RoomManager):
         self.web_client = WebClient(token=SLACK_BOT_TOKEN)
@@ -19,6 +51,16 @@ class SlackBot:
         )
         self.room_manager = room_manager
         self.message_handler = MessageHandler(room_manager)
+        # Replies go through this pool so slow Slack API roundtrips don't
+        # block the socket-mode listener thread
+        self._pool = ThreadPoolExecutor(max_workers=8)
+        # O(1) slash-command dispatch instead of an if/elif chain
+        self._command_handlers = {
+            "/book": self._cmd_book,
+            "/rooms": self._cmd_rooms,
+            "/mybookings": self._cmd_mybookings,
+            "/calendar": self._cmd_calendar,
+        }
         self.client.socket_mode_request_listeners.append(self.process_message)
         self._test_connection()
         
@@ -57,7 +99,8 @@ Command Details:
             
             try:
                 response = self._handle_slash_command(command)
-                self.web_client.chat_postEphemeral(
+                self._pool.submit(
+                    self.web_client.chat_postEphemeral,
                     channel=command["channel_id"],
                     user=command["user_id"],
                     text=f"You typed: `{user_command}`\n\n{response}"
@@ -65,7 +108,8 @@ Command Details:
                 
             except Exception as e:
                 logging.error(f"Error handling slash command: {e}", exc_info=True)
-                self.web_client.chat_postEphemeral(
+                self._pool.submit(
+                    self.web_client.chat_postEphemeral,
                     channel=command["channel_id"],
                     user=command["user_id"],
                     text="Sorry, I encountered an error processing your request."
@@ -87,58 +131,47 @@ Command Details:
         command_type = command["command"]
         text = command["text"].strip()
         user_id = command["user_id"]
-        
-        if command_type == "/book":
-            if not text:
-                return (
-                        "Please use one of these formats:\n\n"
-                        "*Single Booking:*\n"
-                        "`/book [room], [date], [time], [duration], [event details], [internal/client], [Full Contact Name]`\n\n"
-                        "*Recurring Booking:*\n"
-                        "`/book recurring [room], [start date], [end date], [frequency], [time], [duration], [event details], [internal/client], [Full Contact Name]`\n\n"
-                        "*Examples:*\n"
-                        "• `/book nest, tomorrow, 2pm, 2 hours, Team Meeting, internal, John Smith`\n"
-                        "• `/book recurring nest, 22nd Nov, 22nd Dec, weekly, 2pm, 2 hours, Team Sync, internal, John Smith`\n"
-                        "*Date formats:* 'today', 'tomorrow', '28th Nov', '22nd of November', '19/12', '19/12/2024'\n"
-                        "*Supported Frequencies:* daily, weekly, biweekly, monthly\n"
-                        "*Duration formats accepted:*\n"
-                        "• Hours: '3h', '3 h', '3 hours'\n"
-                        "• Minutes: '45m', '45 m', '45 minutes'\n"
-                        "• Combined: '2 hours 30 minutes', '2h 30m'\n\n"
-                        )
-            if text.startswith('recurring '):
-                return self.message_handler.handle_message(f"book {text}", user_id)
-            return self.message_handler.handle_message(f"book {text}", user_id)
-    
-        
-        elif command_type == "/rooms":
-            if not text:
-                # Get list of all rooms
-                rooms = self.room_manager.get_all_rooms()
-                response = ["Available Rooms:"]
-                for room in sorted(rooms, key=lambda x: x.name):
-                    response.append(f"• {room.name} (Capacity: {room.capacity})")
-                return "\n".join(response)
-            elif text.startswith('available '):
-                date = text[len('available '):].strip()
-                return self.message_handler.handle_message(f"list available rooms for {date}", user_id)
-            return "Use `/rooms` or `/rooms available [date]`."
-        
-        elif command_type == "/mybookings":
-            if not text:
-                return self.message_handler.handle_message("list my bookings", user_id)
-            elif text.startswith('cancel '):
-                numbers = text[7:].strip()
-                if numbers == "all":
-                    return self.message_handler.handle_message("cancel all bookings", user_id)
-                return self.message_handler.handle_message(f"cancel booking {numbers}", user_id)
-            return "Invalid format. Use `/mybookings` or `/mybookings cancel [number(s)]` or `/mybookings cancel all`"
-        
-        elif command_type == "/calendar":
-            if not text:
-                return "Please specify month, e.g., `/calendar December`"
-            return self.message_handler.handle_message(f"calendar view {text}", user_id)
-        
+        handler = self._command_handlers.get(command_type, self._cmd_unknown)
+        return handler(text, user_id)
+
+    def _cmd_book(self, text: str, user_id: str) -> str:
+        if not text:
+            return _BOOK_HELP
+        # Split the comma-separated argument list here so the handler can
+        # work with structured fields instead of re-parsing one blob
+        parts = [p.strip() for p in text.split(',')]
+        return self.message_handler.handle_book(parts, user_id)
+
+    def _cmd_rooms(self, text: str, user_id: str) -> str:
+        if not text:
+            # Get list of all rooms
+            rooms = self.room_manager.get_all_rooms()
+            response = ["Available Rooms:"]
+            for room in sorted(rooms, key=lambda x: x.name):
+                response.append(f"• {room.name} (Capacity: {room.capacity})")
+            return "\n".join(response)
+        elif text.startswith('available '):
+            date = text[len('available '):].strip()
+            return self.message_handler.handle_message("list available rooms for " + date, user_id)
+        return "Use `/rooms` or `/rooms available [date]`."
+
+    def _cmd_mybookings(self, text: str, user_id: str) -> str:
+        if not text:
+            return self.message_handler.handle_message("list my bookings", user_id)
+        elif text.startswith('cancel '):
+            numbers = text[7:].strip()
+            if numbers == "all":
+                return self.message_handler.handle_message("cancel all bookings", user_id)
+            return self.message_handler.handle_message("cancel booking " + numbers, user_id)
+        return "Invalid format. Use `/mybookings` or `/mybookings cancel [number(s)]` or `/mybookings cancel all`"
+
+    def _cmd_calendar(self, text: str, user_id: str) -> str:
+        if not text:
+            return "Please specify month, e.g., `/calendar December`"
+        return self.message_handler.handle_message("calendar view " + text, user_id)
+
+    def _cmd_unknown(self, text: str, user_id: str) -> str:
+        return "Sorry, I don't recognize that command."
 
     def start(self):
         """Start the Slack bot."""
@@ -148,15 +181,4 @@ Command Details:
         
     def _get_welcome_message(self) -> str:
         """Return the welcome message with available commands."""
-        return (
-            "Hello! Here are the available commands:\n\n"
-            "*Begin Booking Process:*\n"
-            "• `/book` - Single bookings or recurring bookings\n"
-            "*Calendar View*\n"
-            "• `/calendar [month]` - View calendar for a specific month\n"
-            "*Other Commands:*\n"
-            "• `/rooms` - List all rooms\n"
-            "• `/rooms available [date]` - Check room availability\n"
-            "• `/mybookings` - View your bookings\n"
-            "• `/mybookings cancel [number(s)]` - Cancel specific bookings after viewing them\n"
-        )
+        return _WELCOME_MSG
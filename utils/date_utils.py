@@ -1,23 +1,74 @@
 # utils/date_utils.py
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Optional
 import calendar
 import logging
+import string
 
-def parse_date_time(date_str: str, time_str: str) -> datetime:
+_log = logging.getLogger(__name__)
+
+# ASCII-only lowercase mapping; translate() does the case fold in a
+# single C-level pass over the (short) input strings
+_LOWER_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Month-name lookup built once at import; parse_date_time used to rebuild
+# these dicts from calendar.month_name/month_abbr on every call.
+_MONTHS = {month.lower(): i for i, month in enumerate(calendar.month_name) if month}
+_MONTHS.update({month.lower(): i for i, month in enumerate(calendar.month_abbr) if month})
+
+def _parse_time(time_str: str) -> Optional[time]:
+    """Parse the accepted time formats ('2pm', '2:30pm', '14:00', '9')
+    directly instead of trying strptime format strings. Returns None for
+    out-of-range values; raises ValueError on non-numeric input."""
+    if time_str.endswith('am') or time_str.endswith('pm'):
+        is_pm = time_str.endswith('pm')
+        body = time_str[:-2].strip()
+        if ':' in body:
+            hour_str, minute_str = body.split(':', 1)
+            hour, minute = int(hour_str), int(minute_str)
+        else:
+            hour, minute = int(body), 0
+        if not 1 <= hour <= 12:
+            return None
+        if hour == 12:
+            hour = 0
+        if is_pm:
+            hour += 12
+    else:
+        if ':' in time_str:
+            hour_str, minute_str = time_str.split(':', 1)
+            hour, minute = int(hour_str), int(minute_str)
+        else:
+            hour, minute = int(time_str), 0
+    if hour > 23 or minute > 59:
+        return None
+    return time(hour, minute)
+
+def parse_date_time(date_str: str, time_str: str) -> Optional[datetime]:
     """Parse date and time strings into a datetime object."""
-    logging.debug(f"Attempting to parse date: '{date_str}' and time: '{time_str}'")
+    # Keyed on today's ordinal so cached "today"/"tomorrow" results roll
+    # over correctly at midnight
+    return _parse_impl(date_str, time_str, date.today().toordinal())
+
+@lru_cache(maxsize=512)
+def _parse_impl(date_str: str, time_str: str, today_ord: int) -> Optional[datetime]:
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug("Attempting to parse date: %r and time: %r", date_str, time_str)
     
-    # Ensure inputs are strings and strip whitespace
-    if not isinstance(date_str, str) or not isinstance(time_str, str):
-        logging.debug("Invalid input types")
+    # Duck-type the inputs: anything without str methods fails here
+    # instead of paying an isinstance check on every call
+    try:
+        date_str = date_str.translate(_LOWER_TABLE).strip()
+        # Date-only callers pass "" for the time; skip normalizing it
+        time_str = time_str.translate(_LOWER_TABLE).strip() if time_str else ""
+    except AttributeError:
+        _log.debug("Invalid input types")
         return None
-        
-    date_str = date_str.lower().strip()
-    time_str = time_str.lower().strip()
-    logging.debug(f"Processed inputs - date: '{date_str}', time: '{time_str}'")
+    _log.debug("Processed inputs - date: %r, time: %r", date_str, time_str)
     
-    # Get current date
-    today = datetime.now()
+    # Current date at midnight; the time component never matters here
+    today = datetime.fromordinal(today_ord)
     
     # Handle relative dates
     if date_str == "today":
@@ -25,18 +76,30 @@ def parse_date_time(date_str: str, time_str: str) -> datetime:
     elif date_str == "tomorrow":
         target_date = today + timedelta(days=1)
     else:
+        # Set when the year was inferred rather than given explicitly, so
+        # the branch below knows whether to roll past dates to next year
+        # without re-splitting the input
+        year_inferred = False
         try:
             # Try to parse date in DD/MM or DD/MM/YYYY format
             if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 2:  # DD/MM format
-                    day, month = map(int, parts)
-                    year = today.year
-                elif len(parts) == 3:  # DD/MM/YYYY format
-                    day, month, year = map(int, parts)
+                # Fast path for fully-specified DD/MM/YYYY: known slash
+                # positions mean we can slice straight to ints
+                if len(date_str) == 10 and date_str[2] == '/' and date_str[5] == '/':
+                    day = int(date_str[:2])
+                    month = int(date_str[3:5])
+                    year = int(date_str[6:])
                 else:
-                    logging.debug(f"Invalid slash format: {date_str}")
-                    return None
+                    parts = date_str.split('/')
+                    if len(parts) == 2:  # DD/MM format
+                        day, month = map(int, parts)
+                        year = today.year
+                        year_inferred = True
+                    elif len(parts) == 3:  # DD/MM/YYYY format
+                        day, month, year = map(int, parts)
+                    else:
+                        _log.debug("Invalid slash format: %s", date_str)
+                        return None
                 
                 target_date = datetime(year, month, day)
                 
@@ -48,69 +111,58 @@ def parse_date_time(date_str: str, time_str: str) -> datetime:
                 
                 # We should now have exactly 2 parts (day and month)
                 if len(parts) != 2:
-                    logging.debug(f"Invalid parts length after removing 'of': {len(parts)}")
+                    _log.debug("Invalid parts length after removing 'of': %d", len(parts))
                     return None
                 
                 day_str, month_str = parts
                 
-                # Remove ordinal indicators (st, nd, rd, th) from day
-                day = int(day_str.replace('st', '').replace('nd', '').replace('rd', '').replace('th', ''))
-                logging.debug(f"Parsed day: {day}, month: '{month_str}'")
-                
-                # Get month number (1-12)
-                month_names = {month.lower(): i for i, month in enumerate(calendar.month_name) if month}
-                month_abbr = {month.lower(): i for i, month in enumerate(calendar.month_abbr) if month}
+                # Remove ordinal indicators (st, nd, rd, th) from day in a
+                # single slice instead of four chained replace() passes
+                if day_str[-2:].isalpha():
+                    day_str = day_str[:-2]
+                day = int(day_str)
+                _log.debug("Parsed day: %d, month: %r", day, month_str)
                 
-                if month_str in month_names:
-                    month = month_names[month_str]
-                elif month_str in month_abbr:
-                    month = month_abbr[month_str]
-                else:
-                    logging.debug(f"Could not parse month: '{month_str}'")
+                # Get month number (1-12); fall back to the 3-letter
+                # prefix so "nov." and truncated forms still resolve
+                month = _MONTHS.get(month_str) or _MONTHS.get(month_str.rstrip('.')[:3])
+                if month is None:
+                    _log.debug("Could not parse month: %r", month_str)
                     return None
                 
-                logging.debug(f"Resolved month number: {month}")
+                _log.debug("Resolved month number: %d", month)
                 target_date = datetime(today.year, month, day)
+                year_inferred = True
             
-            logging.debug(f"Initial target date: {target_date}")
+            _log.debug("Initial target date: %s", target_date)
             
             # If the date has already passed this year, use next year
-            # (only for non-slash formats or when year wasn't specified)
-            if '/' not in date_str or len(date_str.split('/')) == 2:
-                if target_date.date() < today.date():
-                    target_date = target_date.replace(year=today.year + 1)
-                    logging.debug(f"Date adjusted to next year: {target_date}")
+            # (only when the year wasn't specified)
+            if year_inferred and target_date.toordinal() < today.toordinal():
+                target_date = target_date.replace(year=today.year + 1)
+                _log.debug("Date adjusted to next year: %s", target_date)
             
         except (ValueError, AttributeError) as e:
-            logging.debug(f"Error parsing date: {str(e)}")
+            _log.debug("Error parsing date: %s", e)
             return None
     
     # For list available rooms command, we don't need time parsing
     if time_str == "":
-        logging.debug("No time provided, returning date only")
+        _log.debug("No time provided, returning date only")
         return target_date
     
     # Parse time
     try:
-        time_str = time_str.lower().strip().replace('.', ':')  # Convert 2.30pm to 2:30pm
-        
-        if "am" in time_str or "pm" in time_str:
-            # Handle both formats: "2pm" and "2:30pm"
-            if ':' in time_str:
-                time = datetime.strptime(time_str, "%I:%M%p").time()
-            else:
-                time = datetime.strptime(time_str, "%I%p").time()
-        else:
-            # Handle 24-hour format
-            if ':' in time_str:
-                time = datetime.strptime(time_str, "%H:%M").time()
-            else:
-                time = datetime.strptime(time_str, "%H").time()
-            
-        result = datetime.combine(target_date.date(), time)
-        logging.debug(f"Final datetime: {result}")
+        time_str = time_str.replace('.', ':')  # Convert 2.30pm to 2:30pm; already normalized above
+
+        parsed_time = _parse_time(time_str)
+        if parsed_time is None:
+            _log.debug("Time out of range: %r", time_str)
+            return None
+        result = datetime.combine(target_date.date(), parsed_time)
+        _log.debug("Final datetime: %s", result)
         return result
     except ValueError as e:
-        logging.debug(f"Error parsing time: {str(e)}")
+        _log.debug("Error parsing time: %s", e)
         return None
     
\ No newline at end of file